@@ -12,4 +12,3 @@ __all__: list[str] = []
 
 from .base import *
 from .represent import *
-from .views import *
\ No newline at end of file
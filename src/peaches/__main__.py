@@ -0,0 +1,462 @@
+"""
+__main__: command line interface for streaming files through peaches
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2023, Corey Rayburn Yung
+License: Apache-2.0
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+Contents:
+    main: parses command line arguments and prints a beautiful str
+        representation of each record in the passed files.
+    read_json: yields each top-level value in a JSON file using a bounded
+        amount of memory.
+    read_json_lines: yields each record in a JSON lines file.
+    read_pickle: yields each pickled object in a file of consecutive pickles.
+    _get_positive: converts a command line argument to a positive int.
+    _tokenize_json: yields JSON tokens from a text stream read in chunks.
+    _parse_json: builds truncated python objects from JSON tokens.
+
+ToDo:
+    Keep a tail or reservoir of the entries '_parse_json' skips so that
+        '--sampling' can be used with JSON documents.
+
+"""
+from __future__ import annotations
+import argparse
+from collections.abc import Iterator, MutableSequence
+import contextlib
+import json
+import pathlib
+import pickle
+import re
+import sys
+from typing import IO, Any, Optional
+
+from . import represent
+
+
+CHUNK_SIZE: int = 65536
+LOOKAHEAD: int = 64
+MAX_KEPT: int = 65536
+SPACES: re.Pattern = re.compile(r'[ \t\n\r]*')
+PLAIN: re.Pattern = re.compile(r'[^"\\]*')
+SCALAR: re.Pattern = re.compile(
+    r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null')
+EXPECTED: dict[str, tuple[str, ...]] = {
+    'a value': ('{', '[', 'string', 'scalar'),
+    "a value or ']'": ('{', '[', 'string', 'scalar', ']'),
+    'a key': ('string',),
+    "a key or '}'": ('string', '}'),
+    "':'": (':',),
+    "',' or ']'": (',', ']'),
+    "',' or '}'": (',', '}')}
+SUFFIXES: dict[str, str] = {
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.pkl': 'pickle',
+    '.pickle': 'pickle'}
+
+
+""" Public Functions """
+
+def main(arguments: Optional[MutableSequence[str]] = None) -> int:
+    """Prints a beautiful str representation of each record in files.
+
+    Args:
+        arguments (Optional[MutableSequence[str]]): command line arguments. If
+            None, 'sys.argv' is used. Defaults to None.
+
+    Returns:
+        int: exit status, which is 1 if any file could not be read.
+
+    """
+    parser = _get_parser()
+    options = parser.parse_args(arguments)
+    kinds = []
+    for path in options.paths:
+        kind = options.format
+        if kind == 'auto':
+            kind = SUFFIXES.get(pathlib.Path(path).suffix.lower(), 'json')
+        kinds.append(kind)
+    if options.sampling and 'json' in kinds:
+        parser.error(
+            '--sampling cannot be used with JSON documents because only the '
+            'first entries of each container are read')
+    represent.MAX_LENGTH = options.max_length
+    represent.MAX_WIDTH = options.max_width
+    represent.MAX_STRING = options.max_string
+    represent.MAX_BYTES = options.max_bytes
+    represent.SAMPLING = options.sampling
+    status = 0
+    for path, kind in zip(options.paths, kinds):
+        mode = 'rb' if kind == 'pickle' else 'r'
+        try:
+            with _open(path = path, mode = mode) as stream:
+                if kind == 'pickle':
+                    records = read_pickle(stream = stream)
+                elif kind == 'jsonl':
+                    records = read_json_lines(stream = stream)
+                else:
+                    records = read_json(
+                        stream = stream,
+                        limit = options.max_length)
+                for record in records:
+                    sys.stdout.write(represent.beautify(record))
+                    sys.stdout.write(represent.LINE_BREAK)
+                    sys.stdout.flush()
+        except (
+            AttributeError, 
+            ImportError, 
+            OSError, 
+            ValueError, 
+            pickle.UnpicklingError) as error:
+            sys.stderr.write(f'peaches: {path}: {error}{represent.LINE_BREAK}')
+            status = 1
+    return status
+
+def read_json(stream: IO[str], limit: int) -> Iterator[Any]:
+    """Yields each top-level value in a JSON 'stream'.
+
+    'stream' is read in chunks of 'CHUNK_SIZE' characters. Containers keep at
+    most 'limit' + 1 entries (enough for 'beautify' to mark them as
+    incomplete) and the remaining entries are read and discarded. Strings keep
+    at most 'MAX_KEPT' characters. Memory use therefore depends on 'limit'
+    and the nesting depth rather than the size of 'stream'.
+
+    Args:
+        stream (IO[str]): text stream of one or more JSON documents.
+        limit (int): number of entries in a container to show.
+
+    Yields:
+        Any: each top-level value in 'stream'.
+
+    Raises:
+        ValueError: if 'stream' is not valid JSON.
+
+    """
+    tokens = _tokenize_json(stream = stream)
+    yield from _parse_json(tokens = tokens, limit = limit)
+
+def read_json_lines(stream: IO[str]) -> Iterator[Any]:
+    """Yields each record in a JSON lines 'stream'.
+
+    Args:
+        stream (IO[str]): text stream with one JSON document per line.
+
+    Yields:
+        Any: each record in 'stream'.
+
+    """
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+def read_pickle(stream: IO[bytes]) -> Iterator[Any]:
+    """Yields each object in a 'stream' of consecutive pickles.
+
+    Each object is loaded on its own, so only one is in memory at a time.
+    Only use this with trusted files because unpickling can run arbitrary
+    code.
+
+    Args:
+        stream (IO[bytes]): binary stream of one or more pickles.
+
+    Yields:
+        Any: each unpickled object in 'stream'.
+
+    """
+    while True:
+        try:
+            yield pickle.load(stream)
+        except EOFError:
+            return
+
+""" Private Functions """
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Returns parser for the command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: parser with the peaches options.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog = 'peaches',
+        description = (
+            'Prints beautiful representations of records in JSON, JSON lines, '
+            'or pickle files without loading whole files into memory.'))
+    parser.add_argument(
+        'paths',
+        nargs = '+',
+        help = "files to read ('-' for stdin)")
+    parser.add_argument(
+        '--format',
+        choices = ['auto', 'json', 'jsonl', 'pickle'],
+        default = 'auto',
+        help = 'file format, inferred from the file suffix by default')
+    parser.add_argument(
+        '--max-length',
+        type = _get_positive,
+        default = represent.MAX_LENGTH,
+        help = 'number of entries shown for each collection')
+    parser.add_argument(
+        '--max-width',
+        type = _get_positive,
+        default = represent.MAX_WIDTH,
+        help = 'width used for shortened values')
+    parser.add_argument(
+        '--max-string',
+        type = _get_positive,
+        default = represent.MAX_STRING,
+        help = 'number of characters shown for long strings')
+    parser.add_argument(
+        '--max-bytes',
+        type = _get_positive,
+        default = represent.MAX_BYTES,
+        help = 'number of bytes previewed for binary buffers')
+    parser.add_argument(
+        '--sampling',
+        choices = list(represent.samplers),
+        default = represent.SAMPLING,
+        help = (
+            'how to choose entries shown for large collections (not '
+            'supported for JSON documents)'))
+    return parser
+
+def _get_positive(text: str) -> int:
+    """Returns 'text' as an int if it is greater than 0.
+
+    Args:
+        text (str): command line argument to convert.
+
+    Returns:
+        int: converted 'text'.
+
+    Raises:
+        argparse.ArgumentTypeError: if 'text' is not a positive int.
+
+    """
+    try:
+        number = int(text)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            f'{text!r} is not a positive integer')
+    return number
+
+@contextlib.contextmanager
+def _open(path: str, mode: str) -> Iterator[IO[Any]]:
+    """Opens 'path' or, if 'path' is '-', yields stdin.
+
+    Args:
+        path (str): path of file to open or '-'.
+        mode (str): mode for opening the file ('r' or 'rb').
+
+    Yields:
+        IO[Any]: opened stream.
+
+    """
+    if path == '-':
+        yield sys.stdin.buffer if 'b' in mode else sys.stdin
+    else:
+        encoding = None if 'b' in mode else 'utf-8'
+        with open(path, mode, encoding = encoding) as stream:
+            yield stream
+
+def _tokenize_json(stream: IO[str]) -> Iterator[tuple[str, Any, int]]:
+    """Yields JSON tokens from 'stream'.
+
+    Args:
+        stream (IO[str]): text stream of JSON.
+
+    Yields:
+        tuple[str, Any, int]: kinds of tokens ('{', '}', '[', ']', ':', ',',
+            'string', or 'scalar'), their values (None for punctuation), and
+            their positions in 'stream'.
+
+    Raises:
+        ValueError: if a string, escape, or scalar in 'stream' is invalid.
+
+    """
+    buffer = ''
+    position = 0
+    consumed = 0
+    finished = False
+
+    def refill() -> bool:
+        nonlocal buffer, position, consumed, finished
+        if finished:
+            return False
+        chunk = stream.read(CHUNK_SIZE)
+        buffer = buffer[position:] + chunk
+        consumed += position
+        position = 0
+        finished = not chunk
+        return bool(chunk)
+
+    while True:
+        position = SPACES.match(buffer, position).end()
+        if position == len(buffer):
+            if refill():
+                continue
+            return
+        character = buffer[position]
+        offset = consumed + position
+        if character in '{}[]:,':
+            position += 1
+            yield character, None, offset
+        elif character == '"':
+            position += 1
+            pieces = []
+            kept = 0
+            while True:
+                end = PLAIN.match(buffer, position).end()
+                if kept < MAX_KEPT:
+                    stop = min(end, position + MAX_KEPT - kept)
+                    piece = buffer[position:stop]
+                    pieces.append(piece)
+                    kept += len(piece)
+                position = end
+                if position == len(buffer):
+                    if not refill():
+                        raise ValueError(
+                            f'unterminated string at position {offset} in '
+                            'JSON')
+                elif buffer[position] == '"':
+                    position += 1
+                    break
+                else:
+                    while len(buffer) - position < 2:
+                        if not refill():
+                            raise ValueError(
+                                f'incomplete escape at position '
+                                f'{consumed + position} in JSON')
+                    size = 6 if buffer[position + 1] == 'u' else 2
+                    while len(buffer) - position < size:
+                        if not refill():
+                            raise ValueError(
+                                f'incomplete escape at position '
+                                f'{consumed + position} in JSON')
+                    if kept < MAX_KEPT:
+                        pieces.append(buffer[position:position + size])
+                        kept += size
+                    position += size
+            text = json.loads(f'"{"".join(pieces)}"')
+            if kept >= MAX_KEPT:
+                text = f'{text}{represent.INCOMPLETE}'
+            yield 'string', text, offset
+        else:
+            while len(buffer) - position < LOOKAHEAD and refill():
+                pass
+            match = SCALAR.match(buffer, position)
+            while (
+                (match is None or match.end() == len(buffer))
+                and refill()):
+                match = SCALAR.match(buffer, position)
+            if match is None:
+                raise ValueError(
+                    f'unexpected character {character!r} at position '
+                    f'{offset} in JSON')
+            position = match.end()
+            yield 'scalar', json.loads(match.group()), offset
+
+def _parse_json(
+    tokens: Iterator[tuple[str, Any, int]],
+    limit: int) -> Iterator[Any]:
+    """Yields top-level values built from JSON 'tokens'.
+
+    An explicit stack is used so deeply nested documents do not hit the
+    recursion limit. Entries past 'limit' + 1 in a container are skipped
+    without being built, but every token is still checked against the kinds
+    in 'EXPECTED' so that malformed JSON raises an error instead of being
+    built into the wrong value.
+
+    Args:
+        tokens (Iterator[tuple[str, Any, int]]): tokens from '_tokenize_json'.
+        limit (int): number of entries in a container to show.
+
+    Yields:
+        Any: each top-level value.
+
+    Raises:
+        ValueError: if 'tokens' are not in a valid JSON order.
+
+    """
+    stack = []
+    nesting = []
+    skipping = 0
+    expected = 'a value'
+    for kind, value, offset in tokens:
+        if kind not in EXPECTED[expected]:
+            found = kind if kind in ('string', 'scalar') else repr(kind)
+            raise ValueError(
+                f'expected {expected} but found {found} at position '
+                f'{offset} in JSON')
+        is_key = kind == 'string' and expected in ('a key', "a key or '}'")
+        if kind == '{':
+            nesting.append(kind)
+            expected = "a key or '}'"
+        elif kind == '[':
+            nesting.append(kind)
+            expected = "a value or ']'"
+        elif kind == ',':
+            expected = 'a key' if nesting[-1] == '{' else 'a value'
+        elif kind == ':' or is_key:
+            expected = "':'" if is_key else 'a value'
+        else:
+            if kind in ('}', ']'):
+                nesting.pop()
+            if not nesting:
+                expected = 'a value'
+            elif nesting[-1] == '{':
+                expected = "',' or '}'"
+            else:
+                expected = "',' or ']'"
+        if kind in (',', ':'):
+            continue
+        if skipping:
+            if kind in ('{', '['):
+                skipping += 1
+            elif kind in ('}', ']'):
+                skipping -= 1
+                if not skipping:
+                    stack[-1][1] = None
+            continue
+        if kind in ('}', ']'):
+            value = stack.pop()[0]
+        elif is_key:
+            stack[-1][1] = value
+            continue
+        elif kind in ('{', '['):
+            if stack and len(stack[-1][0]) > limit:
+                skipping = 1
+            else:
+                stack.append([{} if kind == '{' else [], None])
+            continue
+        if not stack:
+            yield value
+        elif len(stack[-1][0]) > limit:
+            stack[-1][1] = None
+        elif isinstance(stack[-1][0], dict):
+            stack[-1][0][stack[-1][1]] = value
+            stack[-1][1] = None
+        else:
+            stack[-1][0].append(value)
+    if nesting:
+        raise ValueError(f'expected {expected} but found end of JSON')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
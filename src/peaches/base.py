@@ -18,6 +18,7 @@ License: Apache-2.0
 
 Contents:
     Representation (object): data for a data type's representation.
+    Registry (dict): dict that counts writes to its entries.
          
 ToDo:
     Completely rewrite. Consider removing class entirely (or moving it to a 
@@ -60,9 +61,66 @@ class Representation(object):
             Defaults to ''.
         end (str): ending bracket for listing the contents of the data type.
             Defaults to ''.           
+        color (str): ANSI escape sequence used to color 'name' when colored
+            output is enabled. Defaults to ''.
     
     """
     name: str
     method: FunctionType
     start: str = ''
     end: str = ''
+    color: str = ''
+
+
+class Registry(dict):
+    """dict that counts writes to its entries.
+    
+    'version' is increased by every method call that adds, replaces, or 
+    removes an entry, so caches built from a Registry can tell when they are 
+    stale even if its length does not change. Calls that leave the entries as
+    they were (e.g., popping a missing key) do not change 'version'.
+    
+    Attributes:
+        version (int): number of writes since the Registry was created.
+    
+    """
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version: int = 0
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        if key not in self or self[key] is not value:
+            super().__setitem__(key, value)
+            self.version += 1
+
+    def __delitem__(self, key: Hashable) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other: Any) -> Registry:
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        if self:
+            super().clear()
+            self.version += 1
+
+    def pop(self, key: Hashable, *args: Any) -> Any:
+        if key in self:
+            self.version += 1
+        return super().pop(key, *args)
+
+    def popitem(self) -> tuple[Hashable, Any]:
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def setdefault(self, key: Hashable, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
@@ -17,11 +17,17 @@ License: Apache-2.0
     limitations under the License.
 
 Contents:
-    facades (dict): dictionary of different supported types with Representation
-        instances as values.
+    facades (Registry): dictionary of different supported types with
+        Representation instances as values.
+    priorities (Registry): dictionary of types in 'facades' with priorities used
+        when an item matches more than one type.
+    samplers (dict): dictionary of supported 'SAMPLING' modes with functions
+        that choose positions in a collection as values.
     beautify: provides a pretty str summary for an object. The
         function uses the 'LINE_BREAK' and 'INDENT' module-level items for
         the values for new lines and length of an indentation.
+    beautify_diff: returns a beautiful string representation of the changes
+        between two objects, walking only subtrees that differ.
     beautify_dict: returns a beautiful string repreentation of a
         dict or dict-like object.
     beautify_object: returns a beautiful string repreentation of a
@@ -30,10 +36,25 @@ Contents:
         list, set, tuple, list-like, set-like, or tuple-like object.
     beautify_string: returns a beautiful string repreentation of a
         str.
+    register_facade: adds a Representation for a type to 'facades', either
+        directly or as a decorator of a beautify function.
+    cache_info: returns hit and miss statistics for the cache of beautiful
+        str representations used when 'CACHE_SIZE' is not 0.
+    clear_cache: empties the cache of beautiful str representations.
+    display_width: returns the number of terminal columns used by a str,
+        accounting for wide characters and ANSI escape sequences.
+    beautify_bytes: returns a beautiful string representation of a bytes,
+        bytearray, memoryview, mmap, or other binary buffer.
     _get_indent: determines the appropriate indentation for a 
         beautiful str.
+    _render: builds a beautiful str from an explicit stack of work items
+        instead of recursing through nested objects.
     _classify_facade: called by 'beautify' to determine the 
         appropriate function to beautify the passed 'item'.
+    _get_attribute: returns a beautiful str representation of an attribute,
+        evaluating it only as allowed by 'EVALUATE'.
+    _get_sample: chooses which elements of a large collection to show based
+        on 'SAMPLING' and the functions in 'samplers'.
          
 ToDo:
     Completely rewrite. Consider removing class entirely (or moving it to a 
@@ -43,12 +64,24 @@ ToDo:
     
 """
 from __future__ import annotations
+import abc
 from collections.abc import (
     Hashable, Iterable, Mapping, MutableMapping, MutableSequence, Sequence)
+import collections
 import dataclasses
+import functools
 import inspect
+import itertools
+import mmap
+import random
+import re
+import reprlib
+import time
 from types import FunctionType
 from typing import Any, Optional, Type
+import unicodedata
+import weakref
+import zlib
 
 import camina
 
@@ -63,6 +96,24 @@ MAX_WIDTH: int = 40
 MAX_LENGTH: int = 20
 INCOMPLETE: str = '...'
 VERTICAL: bool = True
+MAX_BYTES: int = 16
+MAX_STRING: Optional[int] = None
+COUNT_LINES: bool = False
+SAMPLING: Optional[str] = None
+EVALUATE: str = 'all'
+TIME_BUDGET: float = 0.1
+DISPLAY_WIDTH: bool = False
+COLOR: bool = False
+ESCAPE: str = '\x1b'
+RESET: str = '\x1b[0m'
+ANSI: re.Pattern = re.compile(r'\x1b\[[0-?]*[ -/]*[@-~]')
+CHECKSUM: bool = False
+CHUNK_BYTES: int = 65536
+MAX_CACHED_WIDTH: int = 256
+CACHE_SIZE: int = 0
+VERSION_NAME: str = '_version'
+IMMUTABLE: tuple[Type[Any], ...] = (
+    str, bytes, int, float, complex, frozenset, tuple, range)
 
 
 """ Public Functions"""
@@ -75,6 +126,12 @@ def beautify(
     include_private: bool = False) -> str:
     """Returns a beautiful string representation of 'item'.
 
+    If 'CACHE_SIZE' is not 0, representations of versioned objects and of 
+    frozen dataclasses and frozensets with immutable contents are cached (see
+    '_is_cacheable') and reused while 'item' and the options are unchanged.
+    Nested objects are rendered with an explicit stack (see '_render'), so 
+    deep items do not hit the recursion limit.
+
     Args:
         item (Any): item to be represented.
         offsets (int): number of tabs of whitespace to put before the str
@@ -90,20 +147,49 @@ def beautify(
         str: beautiful str representation of 'item'.
         
     """
-    facade = _classify_facade(item = item)
-    if facade is None:
-        indent = _get_indent(offsets = offsets)
-        summary = f'{indent}None'
-    else:
-        kwargs = {'item': item, 'facade': facade, 'offsets': offsets}
-        if facade.name == 'object':
-            exclude = exclude or []
-            kwargs.update(
-                {'package': package, 
-                 'exclude': exclude,
-                 'include_private': include_private})
-        summary = facade.method(**kwargs)
-    return f'{LINE_BREAK}{summary}'
+    return _render(stack = [
+        (item, offsets, package, exclude, include_private)])
+
+def beautify_diff(old: Any, new: Any, offsets: int = 1) -> str:
+    """Returns a beautiful string representation of changes from 'old' to 'new'.
+
+    'old' and 'new' are walked together using the same facades as 'beautify'.
+    Subtrees that are identical or equal are skipped without being walked, so
+    the cost depends on the size of the changes rather than of the items. At 
+    most 'MAX_LENGTH' changes are shown. Added paths are marked with '+', 
+    removed paths with '-', and changed paths with '~'.
+
+    Args:
+        old (Any): original item.
+        new (Any): changed item.
+        offsets (int): number of tabs of whitespace to put before the str
+            representation. Defaults to 1.
+
+    Returns:
+        str: beautiful str representation of the changes.
+        
+    """
+    indent = _get_indent(offsets = offsets)
+    inner = _get_indent(offsets = offsets, extra = TAB)
+    changes = _get_changes(old = old, new = new, limit = MAX_LENGTH + 1)
+    if not changes:
+        return f'{LINE_BREAK}{indent}diff: {{}}'
+    summary = [f'{indent}diff: {{{LINE_BREAK}']
+    length = len(changes)
+    for i, (mark, path, before, after) in enumerate(changes):
+        if i == MAX_LENGTH:
+            summary.append(f'{inner}{INCOMPLETE}, }}{LINE_BREAK}')
+            break
+        if mark == '~':
+            value = f'{_shorten(before)} -> {_shorten(after)}'
+        elif mark == '+':
+            value = _shorten(after)
+        else:
+            value = _shorten(before)
+        summary.append(f'{inner}{mark} {path}: {value}')
+        summary.append('}' if i + 1 == length else ',')
+        summary.append(LINE_BREAK)
+    return f'{LINE_BREAK}{"".join(summary)}'
    
 def beautify_dict(
     item: Mapping[Hashable, Any], 
@@ -126,14 +212,26 @@ def beautify_dict(
         facade = facades[facade]
     indent = _get_indent(offsets = offsets)
     inner = _get_indent(offsets = offsets, extra = TAB)
-    summary = [f'{indent}{facade.name}: {facade.start}{LINE_BREAK}']
+    summary = [f'{indent}{_get_name(facade)}: {facade.start}{LINE_BREAK}']
     length = len(item)
+    if SAMPLING is not None and length > MAX_LENGTH:
+        sample = _get_sample(item = item.items(), length = length)
+        sample = [
+            (i, f'{_get_preview(key)}: {_get_preview(value)}') 
+            for i, (key, value) in sample]
+        summary.extend(_get_sample_lines(
+            sample = sample, 
+            facade = facade, 
+            offsets = offsets, 
+            length = length))
+        return ''.join(summary)
     for i, (key, value) in enumerate(item.items()):
         if i == MAX_LENGTH:
             summary.append(f'{inner}{INCOMPLETE}, {facade.end}{LINE_BREAK}')
             break
         else:
-            summary.append(f'{inner}{key}: {value}')
+            summary.append(
+                f'{inner}{_get_preview(key)}: {_get_preview(value)}')
             if i + 1 == length:
                 summary.append(f'{facade.end}')
             else:
@@ -167,39 +265,18 @@ def beautify_object(
     """
     if not isinstance(facade, base.Representation):
         facade = facades[facade]
-    if package is None:
-        module = inspect.getmodule(item)
-        if hasattr(module, '__package__'):
-            package = module.__package__
-    if facade.name == 'object':
-        name = camina.namify(item)
-    else:
-        name = ''
-    base = camina.snakify(item.__class__.__name__)
-    indent = _get_indent(offsets = offsets)
-    inner = _get_indent(offsets = offsets, extra = TAB)
-    summary = [f'{indent}']
-    if name and base and package:
-        if name == base:
-            summary.append(f'{package} {name}: {LINE_BREAK}')
-        else:
-            summary.append(f'{name}, ({package} {base}): {LINE_BREAK}')
-    else:
-        if name == base:
-            summary.append(f'{name}: {LINE_BREAK}')
-        else:
-            summary.append(f'{name}, ({base}): {LINE_BREAK}')  
-    if include_private:
-        attributes = [a for a in item.__dict__.keys() if not a.startswith('__')]
-    else:
-        attributes = [a for a in item.__dict__.keys() if not a.startswith('_')]
-    attributes = [a for a in attributes if a not in exclude]
-    inner_offsets = offsets + 2
-    for attribute in attributes:
-        contents = getattr(item, attribute)
-        summary.append(f'{inner}{attribute}: {facade.start}')
-        summary.append(beautify(contents, offsets = inner_offsets))
-    return ''.join(summary)
+    deadline = time.perf_counter() + TIME_BUDGET
+    parts = _get_object_parts(
+        item = item, 
+        facade = facade, 
+        offsets = offsets, 
+        package = package, 
+        exclude = exclude, 
+        include_private = include_private,
+        deadline = deadline)
+    stack = [(_CLOSE, item, None, 0)]
+    stack.extend(reversed(parts))
+    return _render(stack = stack, opened = {id(item)}, deadline = deadline)
 
 def beautify_list(
     item: MutableSequence[Any] | set[Any] | tuple[Any, ...], 
@@ -220,14 +297,23 @@ def beautify_list(
         facade = facades[facade]
     indent = _get_indent(offsets = offsets)
     inner = _get_indent(offsets = offsets, extra = TAB)
-    summary = [f'{indent}{facade.name}: {facade.start}{LINE_BREAK}']
+    summary = [f'{indent}{_get_name(facade)}: {facade.start}{LINE_BREAK}']
     length = len(item)
+    if SAMPLING is not None and length > MAX_LENGTH:
+        sample = _get_sample(item = item, length = length)
+        sample = [(i, _get_preview(sub_item)) for i, sub_item in sample]
+        summary.extend(_get_sample_lines(
+            sample = sample, 
+            facade = facade, 
+            offsets = offsets, 
+            length = length))
+        return ''.join(summary)
     for i, sub_item in enumerate(item):
         if i == MAX_LENGTH:
             summary.append(f'{inner}{INCOMPLETE}, {facade.end}{LINE_BREAK}')
             break
         else:
-            summary.append(f'{inner}{str(sub_item)}')
+            summary.append(f'{inner}{_get_preview(sub_item)}')
             if i + 1 == length:
                 summary.append(f'{facade.end}')
             else:
@@ -236,22 +322,173 @@ def beautify_list(
     return ''.join(summary)
 
 def beautify_string(
-    item: MutableSequence[Any], 
+    item: str, 
     facade: base.Representation | Type[Any], 
     offsets: int) -> str:
-    """[summary]
+    """Returns a beautiful str representation of a str 'item'.
+
+    If 'item' is longer than 'MAX_STRING' (or 'MAX_WIDTH' if 'MAX_STRING' is 
+    None), only a head and tail window of 'item' are shown, followed by its 
+    total length. If 'DISPLAY_WIDTH' is True, the limit is measured in 
+    terminal columns instead of characters. If 'COUNT_LINES' is True, the 
+    number of lines in a windowed 'item' is also shown. Only the windows are 
+    copied from 'item'.
 
     Args:
-        item (str): [description]
-        offsets (int): [description]
+        item (str): item to be represented.
+        facade (base.Representation | Type[Any]): representation for item or 
+            a type matching a key in the 'facades' dict.
+        offsets (int): number of tabs of whitespace to put before the str
+            representation.
 
     Returns:
-        str: [description]
+        str: a beautiful representation of 'item'.
+        
+    """
+    if not isinstance(facade, base.Representation):
+        facade = facades[facade]
+    indent = _get_indent(offsets = offsets)
+    window = _get_window(item = item)
+    if window is None:
+        return f'{indent}{_get_name(facade)}: {facade.start}{item}{facade.end}'
+    details = [f'length: {len(item)}']
+    if COUNT_LINES:
+        details.append(f'lines: {item.count(LINE_BREAK) + 1}')
+    details = ', '.join(details)
+    return (
+        f'{indent}{_get_name(facade)}: {facade.start}{window}{facade.end} '
+        f'({details})')
+
+def beautify_bytes(
+    item: bytes | bytearray | memoryview | mmap.mmap, 
+    facade: base.Representation | Type[Any], 
+    offsets: int) -> str:
+    """Returns a beautiful string representation of a binary buffer 'item'.
+
+    Only the first 'MAX_BYTES' bytes are read for the hex and ascii previews
+    and they are read through a memoryview, so 'item' is never copied. If
+    'CHECKSUM' is True, a crc32 checksum of the entire buffer is added (see
+    '_get_checksum').
+
+    Args:
+        item (bytes | bytearray | memoryview | mmap.mmap): the binary buffer
+            to return a str representation for.
+        facade (base.Representation | Type[Any]): representation for item or 
+            a type matching a key in the 'facades' dict.
+        offsets (int): number of tabs of whitespace to put before the str
+            representation.
+
+    Returns:
+        str: a beautiful representation of 'item'.
+        
     """
     if not isinstance(facade, base.Representation):
         facade = facades[facade]
     indent = _get_indent(offsets = offsets)
-    return f'{indent}{facade.name}: {facade.start}{item}{facade.end}'
+    inner = _get_indent(offsets = offsets, extra = TAB)
+    with memoryview(item) as view:
+        length = view.nbytes
+        if view.c_contiguous:
+            with view.cast('B') as flat:
+                window = bytes(flat[:MAX_BYTES])
+        else:
+            window = view[:MAX_BYTES].tobytes()[:MAX_BYTES]
+        checksum = _get_checksum(view = view) if CHECKSUM else None
+    text = ''.join(chr(b) if 32 <= b < 127 else '.' for b in window)
+    preview = window.hex(WHITESPACE)
+    if length > MAX_BYTES:
+        preview = f'{preview} {INCOMPLETE}'
+        text = f'{text} {INCOMPLETE}'
+    summary = [f'{indent}{_get_name(facade)}: {facade.start}{LINE_BREAK}']
+    summary.append(f'{inner}length: {length},{LINE_BREAK}')
+    if checksum is not None:
+        summary.append(f'{inner}crc32: {checksum:08x},{LINE_BREAK}')
+    summary.append(f'{inner}hex: {preview},{LINE_BREAK}')
+    summary.append(f'{inner}ascii: {text}{facade.end}{LINE_BREAK}')
+    return ''.join(summary)
+
+def display_width(item: str) -> int:
+    """Returns the number of terminal columns needed to display 'item'.
+
+    East Asian wide and fullwidth characters take two columns, combining and
+    format characters take none, and ANSI escape sequences are ignored. 
+    Widths of strings no longer than 'MAX_CACHED_WIDTH' characters are cached,
+    so measuring repeated short strings is a dict lookup. Longer strings are
+    measured each time so that the cache never keeps them alive.
+
+    Args:
+        item (str): text to measure.
+
+    Returns:
+        int: display width of 'item'.
+        
+    """
+    if len(item) <= MAX_CACHED_WIDTH:
+        return _get_display_width(item = item)
+    return _get_display_width.__wrapped__(item = item)
+
+def cache_info() -> dict[str, int]:
+    """Returns statistics for the cache of beautiful str representations.
+
+    Returns:
+        dict[str, int]: numbers of 'hits' and 'misses', the current 'size', 
+            and the 'maxsize' ('CACHE_SIZE') of the cache.
+        
+    """
+    return {
+        'hits': _statistics['hits'], 
+        'misses': _statistics['misses'],
+        'size': len(_renders), 
+        'maxsize': CACHE_SIZE}
+
+def clear_cache() -> None:
+    """Empties the cache of beautiful str representations and its statistics.
+    
+    """
+    _renders.clear()
+    _statistics.clear()
+    return
+
+def register_facade(
+    kind: Type[Any], 
+    facade: Optional[base.Representation] = None,
+    priority: int = 0,
+    **kwargs: Any) -> Any:
+    """Adds a Representation for 'kind' to 'facades'.
+
+    If 'facade' is None, a decorator is returned which makes a Representation
+    from the decorated function and 'kwargs' (e.g., 'name', 'start', 'end').
+    A key that is exactly the type of an item always wins, regardless of
+    'priority'. Otherwise, when an item matches more than one key in
+    'facades', the key with the highest 'priority' is used and, among equal
+    priorities, the most specific key is used.
+
+    Args:
+        kind (Type[Any]): type (or abstract base class) represented by
+            'facade'.
+        facade (Optional[base.Representation]): representation to use for 
+            'kind'. Defaults to None.
+        priority (int): priority of 'facade' when an item matches more than
+            one type. Defaults to 0.
+        kwargs: arguments passed to base.Representation if 'facade' is None.
+
+    Returns:
+        Any: 'facade' or, if 'facade' is None, a decorator.
+        
+    """
+    if facade is None:
+        def decorator(method: FunctionType) -> FunctionType:
+            register_facade(
+                kind = kind, 
+                facade = base.Representation(method = method, **kwargs),
+                priority = priority)
+            return method
+        return decorator
+    facades.pop(kind, None)
+    facades[kind] = facade
+    priorities[kind] = priority
+    _renders.clear()
+    return facade
 
 """ Private Functions """
 
@@ -267,58 +504,959 @@ def _get_indent(offsets: int, extra: int = 0) -> str:
     """
     return offsets * INDENT + extra * WHITESPACE
 
+def _render(
+    stack: list[Any], 
+    opened: Optional[set[int]] = None,
+    deadline: Optional[float] = None) -> str:
+    """Returns a beautiful str built by working through 'stack'.
+
+    Instead of recursing, object facades push their attributes onto 'stack' 
+    as work items. Entries on 'stack' are str fragments to add, work items 
+    '(item, offsets, package, exclude, include_private)' to represent, and
+    markers '(_CLOSE, item, key, start)' that are reached after an object's
+    attributes are finished. Objects that contain themselves are shown as 
+    '<cycle>'.
+
+    Args:
+        stack (list[Any]): entries to work through, last entry first.
+        opened (Optional[set[int]]): ids of objects already being represented.
+            Defaults to None.
+        deadline (Optional[float]): 'time.perf_counter' value after which 
+            descriptors are no longer evaluated when 'EVALUATE' is 'budget'. If
+            None, it is 'TIME_BUDGET' seconds from now. Defaults to None.
+
+    Returns:
+        str: beautiful str representation.
+        
+    """
+    opened = opened or set()
+    known = set()
+    if deadline is None:
+        deadline = time.perf_counter() + TIME_BUDGET
+    parts = []
+    while stack:
+        work = stack.pop()
+        if work.__class__ is str:
+            parts.append(work)
+            continue
+        if work[0] is _CLOSE:
+            _, item, key, start = work
+            opened.discard(id(item))
+            if key is not None:
+                summary = ''.join(parts[start:])
+                _set_cached(item = item, key = key, summary = summary)
+            continue
+        item, offsets, package, exclude, include_private = work
+        key = None
+        if CACHE_SIZE and _is_cacheable(item = item, known = known):
+            key = (
+                id(item), 
+                offsets, 
+                package, 
+                tuple(exclude or ()), 
+                include_private, 
+                _get_settings())
+            summary = _get_cached(item = item, key = key)
+            if summary is not None:
+                parts.append(summary)
+                continue
+        facade = _classify_facade(item = item)
+        if facade is None:
+            summary = f'{LINE_BREAK}{_get_indent(offsets = offsets)}None'
+        elif facade.method is beautify_object:
+            if id(item) in opened:
+                indent = _get_indent(offsets = offsets)
+                parts.append(f'{LINE_BREAK}{indent}<cycle>')
+                continue
+            opened.add(id(item))
+            stack.append((_CLOSE, item, key, len(parts)))
+            parts.append(LINE_BREAK)
+            stack.extend(reversed(_get_object_parts(
+                item = item, 
+                facade = facade, 
+                offsets = offsets, 
+                package = package, 
+                exclude = exclude, 
+                include_private = include_private,
+                deadline = deadline)))
+            continue
+        elif facade.name == 'object':
+            summary = facade.method(
+                item = item, 
+                facade = facade, 
+                offsets = offsets,
+                package = package, 
+                exclude = exclude or [], 
+                include_private = include_private)
+            summary = f'{LINE_BREAK}{summary}'
+        else:
+            summary = f'{LINE_BREAK}{facade.method(item, facade, offsets)}'
+        parts.append(summary)
+        if key is not None:
+            _set_cached(item = item, key = key, summary = summary)
+    return ''.join(parts)
+
+@functools.lru_cache(maxsize = 1024)
+def _snakify(name: str) -> str:
+    """Returns 'name' in snake case, cached because class names repeat.
+
+    Args:
+        name (str): name to convert.
+
+    Returns:
+        str: 'name' in snake case.
+        
+    """
+    return camina.snakify(name)
+
+def _get_settings() -> tuple[Any, ...]:
+    """Returns module-level settings that change a beautiful str.
+
+    Returns:
+        tuple[Any, ...]: current values of the settings.
+        
+    """
+    return (
+        LINE_BREAK, INDENT, MAX_WIDTH, MAX_LENGTH, INCOMPLETE, MAX_BYTES, 
+        MAX_STRING, COUNT_LINES, CHECKSUM, SAMPLING, EVALUATE, TIME_BUDGET, 
+        DISPLAY_WIDTH, COLOR, facades.version, priorities.version)
+
+def _is_cacheable(item: Any, known: Optional[set[int]] = None) -> bool:
+    """Returns whether the beautiful str for 'item' can be cached.
+
+    'item' must support weak references, so the cache never keeps it alive. 
+    It can then be cached if it has a 'VERSION_NAME' attribute or if it is a 
+    frozen dataclass or an instance of a type in 'IMMUTABLE' whose elements 
+    (or fields) are all frozen dataclasses or instances of types in 
+    'IMMUTABLE', because a mutable element would change the beautiful str
+    without changing 'item'. Types in 'IMMUTABLE' such as str and tuple do not
+    support weak references, so they are only cached as part of another item.
+
+    Args:
+        item (Any): item to check.
+        known (Optional[set[int]]): ids of elements already found to be 
+            immutable, which are not checked again. The ids of the elements
+            checked are added to it if 'item' is immutable. Defaults to None.
+
+    Returns:
+        bool: whether 'item' can be cached.
+        
+    """
+    try:
+        weakref.ref(item)
+    except TypeError:
+        return False
+    if getattr(item, VERSION_NAME, None) is not None:
+        return True
+    known = set() if known is None else known
+    checked = []
+    stack = [item]
+    while stack:
+        item = stack.pop()
+        if id(item) in known:
+            continue
+        if isinstance(item, (tuple, frozenset)):
+            stack.extend(item)
+        elif (
+            dataclasses.is_dataclass(item) 
+            and not isinstance(item, type) 
+            and item.__dataclass_params__.frozen):
+            stack.extend(
+                getattr(item, field.name) 
+                for field in dataclasses.fields(item))
+        elif not isinstance(item, IMMUTABLE):
+            return False
+        checked.append(id(item))
+    known.update(checked)
+    return True
+
+def _get_cached(item: Any, key: tuple[Any, ...]) -> Optional[str]:
+    """Returns the cached beautiful str for 'item' if it is still valid.
+
+    Args:
+        item (Any): item to be represented.
+        key (tuple[Any, ...]): identity of 'item' and the options used to 
+            represent it.
+
+    Returns:
+        Optional[str]: cached beautiful str or None if there is no valid entry.
+        
+    """
+    entry = _renders.get(key)
+    if entry is not None:
+        reference, version, summary = entry
+        if (
+            reference() is item 
+            and version == getattr(item, VERSION_NAME, None)):
+            _renders.move_to_end(key)
+            _statistics['hits'] += 1
+            return summary
+        del _renders[key]
+    _statistics['misses'] += 1
+    return None
+
+def _set_cached(item: Any, key: tuple[Any, ...], summary: str) -> None:
+    """Caches 'summary' for 'item'.
+
+    'item' is referenced weakly, so the cache never keeps it alive. The least 
+    recently used entries are evicted when there are more than 'CACHE_SIZE' 
+    entries.
+
+    Args:
+        item (Any): item that was represented, which '_is_cacheable' returned
+            True for.
+        key (tuple[Any, ...]): identity of 'item' and the options used to 
+            represent it.
+        summary (str): beautiful str representation of 'item'.
+        
+    """
+    reference = weakref.ref(item, lambda _: _renders.pop(key, None))
+    version = getattr(item, VERSION_NAME, None)
+    _renders[key] = (reference, version, summary)
+    while len(_renders) > CACHE_SIZE:
+        _renders.popitem(last = False)
+    return
+
+def _get_name(facade: base.Representation) -> str:
+    """Returns the name of 'facade', colored if 'COLOR' is True.
+
+    Args:
+        facade (base.Representation): representation to name.
+
+    Returns:
+        str: name of 'facade' to put in a beautiful str.
+        
+    """
+    if COLOR and facade.color:
+        return f'{facade.color}{facade.name}{RESET}'
+    return facade.name
+
+@functools.lru_cache(maxsize = 4096)
+def _get_display_width(item: str) -> int:
+    """Returns the number of terminal columns needed to display 'item'.
+
+    Args:
+        item (str): text to measure.
+
+    Returns:
+        int: display width of 'item'.
+        
+    """
+    if ESCAPE in item:
+        item = ANSI.sub('', item)
+    if item.isascii():
+        return len(item)
+    return sum(_get_sizes(item = item))
+
+def _get_width(character: str) -> int:
+    """Returns the number of terminal columns used by 'character'.
+
+    Args:
+        character (str): single character to measure.
+
+    Returns:
+        int: 0, 1, or 2.
+        
+    """
+    if (
+        unicodedata.combining(character) 
+        or unicodedata.category(character) in ('Mn', 'Me', 'Cf')):
+        return 0
+    elif unicodedata.east_asian_width(character) in ('W', 'F'):
+        return 2
+    else:
+        return 1
+
+@functools.lru_cache(maxsize = None)
+def _get_widths() -> bytearray:
+    """Returns lookup table of widths for the Basic Multilingual Plane.
+
+    The table is built once, the first time it is needed.
+
+    Returns:
+        bytearray: display widths indexed by code point.
+        
+    """
+    return bytearray(_get_width(chr(i)) for i in range(0x10000))
+
+def _get_sizes(item: str) -> list[int]:
+    """Returns the display width of each character in 'item'.
+
+    Characters in ANSI escape sequences have a width of 0.
+
+    Args:
+        item (str): text to measure.
+
+    Returns:
+        list[int]: display width of each character in 'item'.
+        
+    """
+    widths = _get_widths()
+    sizes = []
+    escaped = False
+    for character in item:
+        if escaped:
+            sizes.append(0)
+            escaped = character == '[' or not '@' <= character <= '~'
+        elif character == ESCAPE:
+            sizes.append(0)
+            escaped = True
+        else:
+            code = ord(character)
+            if code < 0x10000:
+                sizes.append(widths[code])
+            else:
+                sizes.append(_get_width(character))
+    return sizes
+
+def _clip(item: str, width: int, last: bool = False) -> str:
+    """Returns the start (or end) of 'item' that fits in 'width' columns.
+
+    If the clipped text leaves an ANSI escape sequence open, 'RESET' is
+    appended so the color does not spill into the rest of the output.
+
+    Args:
+        item (str): text to clip.
+        width (int): number of terminal columns available.
+        last (bool): whether to keep the end of 'item' instead of the start.
+            Defaults to False.
+
+    Returns:
+        str: clipped 'item'.
+        
+    """
+    sizes = _get_sizes(item = item)
+    if last:
+        sizes.reverse()
+    used = 0
+    count = 0
+    for size in sizes:
+        if used + size > width:
+            break
+        used += size
+        count += 1
+    clipped = item[len(item) - count:] if last else item[:count]
+    if ESCAPE in clipped:
+        codes = ANSI.findall(clipped)
+        if codes and codes[-1] not in (RESET, f'{ESCAPE}[m'):
+            clipped = f'{clipped}{RESET}'
+    return clipped
+
+def _get_object_parts(
+    item: object, 
+    facade: base.Representation, 
+    offsets: int,
+    package: Optional[str],
+    exclude: Optional[MutableSequence[str]],
+    include_private: bool,
+    deadline: float) -> list[Any]:
+    """Returns the parts of a beautiful str representation of an instance.
+
+    Args:
+        item (object): item to be represented.
+        facade (base.Representation): representation for item.
+        offsets (int): number of tabs of whitespace to put before the str
+            representation.
+        package (Optional[str]): name of associated package of 'item'.
+        exclude (Optional[MutableSequence[str]]): names of attributes to 
+            exclude from the str representation.
+        include_private (bool): whether to include attributes with a single 
+            leading underscore.
+        deadline (float): 'time.perf_counter' value after which descriptors
+            are no longer evaluated when 'EVALUATE' is 'budget'.
+
+    Returns:
+        list[Any]: str fragments and work items (see '_render') for the
+            attributes of 'item', in order.
+        
+    """
+    if package is None:
+        module = inspect.getmodule(item)
+        if hasattr(module, '__package__'):
+            package = module.__package__
+    kind = _snakify(item.__class__.__name__)
+    if facade.name != 'object':
+        name = ''
+    elif EVALUATE == 'all':
+        if (
+            isinstance(getattr(item, 'name', None), str) 
+            or hasattr(item, '__name__')):
+            name = camina.namify(item)
+        else:
+            name = kind
+    else:
+        # Only a stored 'name' is read so that a 'name' property is not called.
+        name = None
+        if not inspect.isclass(item):
+            name = getattr(item, '__dict__', {}).get('name')
+        if not isinstance(name, str):
+            name = getattr(item, '__name__', None)
+            name = _snakify(name) if isinstance(name, str) else kind
+    indent = _get_indent(offsets = offsets)
+    inner = _get_indent(offsets = offsets, extra = TAB)
+    summary = [f'{indent}']
+    if name and kind and package:
+        if name == kind:
+            summary.append(f'{package} {name}: {LINE_BREAK}')
+        else:
+            summary.append(f'{name}, ({package} {kind}): {LINE_BREAK}')
+    else:
+        if name == kind:
+            summary.append(f'{name}: {LINE_BREAK}')
+        else:
+            summary.append(f'{name}, ({kind}): {LINE_BREAK}')  
+    stored = getattr(item, '__dict__', {})
+    attributes = list(stored.keys())
+    if EVALUATE == 'all':
+        descriptors = {}
+    else:
+        descriptors = _get_descriptors(item = item)
+        attributes.extend(a for a in descriptors if a not in stored)
+    if include_private:
+        attributes = [a for a in attributes if not a.startswith('__')]
+    else:
+        attributes = [a for a in attributes if not a.startswith('_')]
+    exclude = exclude or []
+    attributes = [a for a in attributes if a not in exclude]
+    inner_offsets = offsets + 2
+    for attribute in attributes:
+        summary.append(f'{inner}{attribute}: {facade.start}')
+        summary.append(_get_attribute(
+            item = item, 
+            attribute = attribute, 
+            descriptor = descriptors.get(attribute),
+            offsets = inner_offsets,
+            deadline = deadline))
+    return summary
+
+def _get_attribute(
+    item: object, 
+    attribute: str, 
+    descriptor: Optional[Any],
+    offsets: int,
+    deadline: float) -> Any:
+    """Returns a work item or placeholder for an attribute of 'item'.
+
+    Whether 'attribute' is evaluated depends on 'EVALUATE'. Attributes that are
+    not evaluated are shown as a placeholder with the name of the descriptor 
+    type (e.g., '<property>').
+
+    Stored values are always read directly from '__dict__'. With 'budget', 
+    descriptors are evaluated on the calling thread until 'deadline' passes,
+    after which the remaining descriptors are shown as placeholders without
+    being called. A getter that has started is never interrupted, so a slow
+    getter can overrun the budget but no getter runs after 'beautify' returns.
+
+    Args:
+        item (object): class instance with 'attribute'.
+        attribute (str): name of the attribute to represent.
+        descriptor (Optional[Any]): property or other descriptor for 
+            'attribute' defined on the class of 'item', if any.
+        offsets (int): number of tabs of whitespace to put before the str
+            representation.
+        deadline (float): 'time.perf_counter' value after which descriptors
+            are no longer evaluated when 'EVALUATE' is 'budget'.
+
+    Returns:
+        Any: work item for '_render' or a placeholder str.
+        
+    """
+    if EVALUATE not in ('all', 'cached', 'none', 'budget'):
+        raise ValueError(
+            "EVALUATE must be 'all', 'cached', 'none', or 'budget'")
+    if EVALUATE == 'all':
+        return (getattr(item, attribute), offsets, None, None, False)
+    indent = _get_indent(offsets = offsets)
+    stored = attribute in getattr(item, '__dict__', {})
+    if (
+        stored 
+        and (
+            descriptor is None 
+            or (
+                EVALUATE == 'cached' 
+                and isinstance(descriptor, functools.cached_property)))):
+        return (item.__dict__[attribute], offsets, None, None, False)
+    elif EVALUATE == 'budget' and descriptor is not None:
+        if time.perf_counter() >= deadline:
+            return f'{LINE_BREAK}{indent}<skipped after {TIME_BUDGET}s>'
+        try:
+            value = getattr(item, attribute)
+        except Exception as error:
+            return f'{LINE_BREAK}{indent}<{error.__class__.__name__}>'
+        return (value, offsets, None, None, False)
+    else:
+        name = descriptor.__class__.__name__
+        return f'{LINE_BREAK}{indent}<{name}>'
+
+def _get_changes(
+    old: Any, 
+    new: Any, 
+    limit: int) -> list[tuple[str, str, Any, Any]]:
+    """Returns paths that differ between 'old' and 'new'.
+
+    An explicit stack is used instead of recursion so that deep items do not
+    hit the recursion limit, and pairs of containers that were already walked
+    are skipped so that cycles terminate. Mappings, lists, tuples, sets, and
+    objects are compared element by element. Everything else is compared as a
+    whole.
+
+    Args:
+        old (Any): original item.
+        new (Any): changed item.
+        limit (int): maximum number of changes to find before stopping.
+
+    Returns:
+        list[tuple[str, str, Any, Any]]: marks ('+', '-', or '~'), paths, old
+            values, and new values of each change, in depth-first order.
+        
+    """
+    changes = []
+    visited = set()
+    stack = [(None, 'item', old, new)]
+    while stack and len(changes) < limit:
+        mark, path, before, after = stack.pop()
+        if mark is not None:
+            changes.append((mark, path, before, after))
+            continue
+        pair = (id(before), id(after))
+        if before is after or pair in visited:
+            continue
+        try:
+            if bool(before == after):
+                continue
+        except Exception:
+            pass
+        facade = _classify_facade(item = before)
+        if facade is None or facade is not _classify_facade(item = after):
+            changes.append(('~', path, before, after))
+            continue
+        if facade.name == 'object':
+            if not (
+                hasattr(before, '__dict__') 
+                and before.__class__ is after.__class__):
+                changes.append(('~', path, before, after))
+                continue
+            before, after = vars(before), vars(after)
+            paths = {k: f'{path}.{k}' for k in itertools.chain(before, after)}
+        elif facade.name == 'dictionary':
+            paths = {
+                k: f'{path}[{k!r}]' for k in itertools.chain(before, after)}
+        elif facade.name in ('list', 'tuple'):
+            before = dict(enumerate(before))
+            after = dict(enumerate(after))
+            paths = {k: f'{path}[{k}]' for k in itertools.chain(before, after)}
+        elif facade.name == 'set':
+            for element in before - after:
+                child = f'{path}{{{_shorten(element)}}}'
+                changes.append(('-', child, element, None))
+            for element in after - before:
+                child = f'{path}{{{_shorten(element)}}}'
+                changes.append(('+', child, None, element))
+            continue
+        else:
+            changes.append(('~', path, before, after))
+            continue
+        visited.add(pair)
+        children = []
+        for key, child in paths.items():
+            if key not in after:
+                children.append(('-', child, before[key], None))
+            elif key not in before:
+                children.append(('+', child, None, after[key]))
+            else:
+                children.append((None, child, before[key], after[key]))
+        stack.extend(reversed(children))
+    return changes[:limit]
+
+def _get_checksum(view: memoryview) -> int:
+    """Returns a crc32 checksum of the bytes in 'view'.
+
+    A non-contiguous 'view' is copied 'CHUNK_BYTES' at a time (or one row at a
+    time if a row is larger) instead of all at once.
+
+    Args:
+        view (memoryview): binary buffer to check.
+
+    Returns:
+        int: crc32 checksum of 'view' in logical order.
+        
+    """
+    if view.c_contiguous:
+        with view.cast('B') as flat:
+            return zlib.crc32(flat)
+    checksum = 0
+    rows = len(view)
+    step = max(1, CHUNK_BYTES * rows // view.nbytes)
+    for start in range(0, rows, step):
+        with view[start:start + step] as chunk:
+            checksum = zlib.crc32(chunk.tobytes(), checksum)
+    return checksum
+
+def _get_preview(item: Any) -> str:
+    """Returns a one line str representation of an element of a collection.
+
+    bytes and bytearray elements longer than 'MAX_BYTES' only show their first
+    'MAX_BYTES' bytes and their length, and long str elements only show the 
+    window from '_get_window' and their length, so a large element in a 
+    collection is never copied in full. Other elements use str.
+
+    Args:
+        item (Any): element to represent.
+
+    Returns:
+        str: representation of 'item'.
+        
+    """
+    if isinstance(item, (bytes, bytearray)) and len(item) > MAX_BYTES:
+        return f'{item[:MAX_BYTES]!r}{INCOMPLETE} (length: {len(item)})'
+    if isinstance(item, str):
+        window = _get_window(item = item)
+        if window is not None:
+            return f'{window} (length: {len(item)})'
+    return str(item)
+
+def _get_window(item: str) -> Optional[str]:
+    """Returns a head and tail window of 'item' if it is too long to show.
+
+    The limit is 'MAX_STRING' (or 'MAX_WIDTH' if 'MAX_STRING' is None), 
+    measured in terminal columns if 'DISPLAY_WIDTH' is True. Only the windows
+    are copied from 'item'.
+
+    Args:
+        item (str): text to shorten.
+
+    Returns:
+        Optional[str]: window of 'item' or None if 'item' fits in the limit.
+        
+    """
+    limit = MAX_WIDTH if MAX_STRING is None else MAX_STRING
+    length = len(item)
+    if DISPLAY_WIDTH:
+        fits = length <= 4 * limit and display_width(item) <= limit
+    else:
+        fits = length <= limit
+    if fits:
+        return None
+    tail = limit // 2
+    head = limit - tail
+    if DISPLAY_WIDTH:
+        start = _clip(item[:4 * head], width = head)
+        end = _clip(item[max(0, length - 4 * tail):], width = tail, last = True)
+        return f'{start}{INCOMPLETE}{end}'
+    else:
+        return f'{item[:head]}{INCOMPLETE}{item[length - tail:]}'
+
+def _shorten(item: Any) -> str:
+    """Returns a str representation of 'item' no longer than 'MAX_WIDTH'.
+
+    Args:
+        item (Any): item to be represented.
+
+    Returns:
+        str: short representation of 'item'.
+        
+    """
+    shortener = reprlib.Repr()
+    shortener.maxstring = MAX_WIDTH
+    shortener.maxother = MAX_WIDTH
+    shortener.maxlist = shortener.maxtuple = shortener.maxdict = MAX_LENGTH
+    shortener.maxset = shortener.maxfrozenset = MAX_LENGTH
+    return shortener.repr(item)
+
+def _get_descriptors(item: object) -> dict[str, Any]:
+    """Returns properties and other descriptors defined on the class of 'item'.
+
+    Methods and other non-data descriptors are skipped, except for 
+    functools.cached_property. Descriptors of builtin classes are also skipped.
+
+    Args:
+        item (object): class instance to find descriptors for.
+
+    Returns:
+        dict[str, Any]: keys are attribute names and values are descriptors.
+        
+    """
+    descriptors = {}
+    if not hasattr(item, '__dict__'):
+        return descriptors
+    for kind in reversed(item.__class__.__mro__):
+        if kind.__module__ == 'builtins':
+            continue
+        for name, value in vars(kind).items():
+            if (
+                isinstance(value, (property, functools.cached_property))
+                or hasattr(value.__class__, '__set__')
+                or hasattr(value.__class__, '__delete__')):
+                descriptors[name] = value
+            else:
+                descriptors.pop(name, None)
+    return descriptors
+
+def _get_sample(item: Iterable[Any], length: int) -> list[tuple[int, Any]]:
+    """Returns 'MAX_LENGTH' elements of 'item' chosen based on 'SAMPLING'.
+
+    If 'item' is a Sequence, only the chosen elements are accessed. Otherwise,
+    'item' is iterated over at most once.
+
+    Args:
+        item (Iterable[Any]): collection to sample from.
+        length (int): number of elements in 'item'.
+
+    Returns:
+        list[tuple[int, Any]]: positions of the chosen elements in 'item' and
+            the elements, in the order they appear in 'item'.
+        
+    """
+    if SAMPLING not in samplers:
+        raise ValueError(
+            f'SAMPLING must be None or one of {", ".join(samplers)}')
+    if length <= MAX_LENGTH:
+        return list(enumerate(item))
+    if isinstance(item, Sequence):
+        return [(i, item[i]) for i in samplers[SAMPLING](length)]
+    if SAMPLING == 'reservoir':
+        sample = []
+        for i, element in enumerate(item):
+            if i < MAX_LENGTH:
+                sample.append((i, element))
+            else:
+                j = random.randint(0, i)
+                if j < MAX_LENGTH:
+                    sample[j] = (i, element)
+        return sorted(sample, key = lambda pair: pair[0])
+    positions = samplers[SAMPLING](length)
+    if not positions:
+        return []
+    if SAMPLING == 'head_tail':
+        head = positions[:MAX_LENGTH - MAX_LENGTH // 2]
+        elements = iter(enumerate(item))
+        sample = list(itertools.islice(elements, len(head)))
+        tail = collections.deque(elements, maxlen = MAX_LENGTH // 2)
+        return sample + list(tail)
+    wanted = iter(positions)
+    target = next(wanted)
+    sample = []
+    for i, element in enumerate(item):
+        if i == target:
+            sample.append((i, element))
+            target = next(wanted, None)
+            if target is None:
+                break
+    return sample
+
+def _get_sample_lines(
+    sample: list[tuple[int, str]],
+    facade: base.Representation,
+    offsets: int,
+    length: int) -> list[str]:
+    """Returns lines for a sampled collection with gaps marked as INCOMPLETE.
+
+    Args:
+        sample (list[tuple[int, str]]): positions and str representations of
+            the sampled elements.
+        facade (base.Representation): representation for the collection.
+        offsets (int): number of tabs of whitespace to put before the str
+            representation.
+        length (int): number of elements in the collection.
+
+    Returns:
+        list[str]: lines to add to a beautiful str representation.
+        
+    """
+    inner = _get_indent(offsets = offsets, extra = TAB)
+    lines = []
+    previous = -1
+    for position, text in sample:
+        if position > previous + 1:
+            lines.append(f'{inner}{INCOMPLETE},{LINE_BREAK}')
+        lines.append(f'{inner}{text},{LINE_BREAK}')
+        previous = position
+    if previous < length - 1:
+        lines.append(f'{inner}{INCOMPLETE}{facade.end}{LINE_BREAK}')
+    else:
+        lines[-1] = f'{inner}{text}{facade.end}{LINE_BREAK}'
+    return lines
+
+def _get_head_tail(length: int) -> list[int]:
+    """Returns positions of the first and last elements of a collection.
+
+    Args:
+        length (int): number of elements in the collection.
+
+    Returns:
+        list[int]: positions of the first and last 'MAX_LENGTH' elements 
+            combined.
+        
+    """
+    tail = MAX_LENGTH // 2
+    head = MAX_LENGTH - tail
+    return list(range(head)) + list(range(length - tail, length))
+
+def _get_strided(length: int) -> list[int]:
+    """Returns evenly spaced positions in a collection.
+
+    Args:
+        length (int): number of elements in the collection.
+
+    Returns:
+        list[int]: 'MAX_LENGTH' evenly spaced positions, including the first 
+            and last positions.
+        
+    """
+    if MAX_LENGTH == 1:
+        return [0]
+    step = (length - 1) / (MAX_LENGTH - 1)
+    return [round(i * step) for i in range(MAX_LENGTH)]
+
+def _get_reservoir(length: int) -> list[int]:
+    """Returns randomly chosen positions in a collection.
+
+    Args:
+        length (int): number of elements in the collection.
+
+    Returns:
+        list[int]: 'MAX_LENGTH' randomly chosen positions in ascending order.
+        
+    """
+    return sorted(random.sample(range(length), MAX_LENGTH))
+
 def _classify_facade(item: Any) -> base.Representation:
-    """[summary]
+    """Returns the Representation in 'facades' to use for 'item'.
+
+    Results are cached by the exact type of 'item', so classifying another 
+    instance of the same type is a single lookup. The cache is cleared when
+    'facades' or 'priorities' is written to or an abstract base class gains a
+    registered subclass.
 
     Args:
-        item (Any): [description]
+        item (Any): item to be represented.
 
     Returns:
-        str: [description]
+        base.Representation: representation for 'item' or None if 'item' is
+            None.
+        
     """
     if item is None:
         return None
-    else:
-        for facade, data in facades.items():
-            if isinstance(item, facade):
-                return data
-    return facades[str]
+    kind = item.__class__
+    global _token
+    token = (abc.get_cache_token(), facades.version, priorities.version)
+    if token != _token:
+        _cache.clear()
+        _token = token
+    try:
+        return _cache[kind]
+    except KeyError:
+        facade = _cache[kind] = _resolve_facade(kind = kind)
+        return facade
+
+def _resolve_facade(kind: Type[Any]) -> base.Representation:
+    """Returns the Representation in 'facades' that best matches 'kind'.
+
+    If 'kind' is itself a key in 'facades', that entry is returned without
+    checking 'priorities'. Otherwise, among the keys in 'facades' that 'kind'
+    is a subclass of, those with the highest value in 'priorities' are kept.
+    Of those, the most specific key is chosen, with ties going to the key
+    registered first.
+
+    Args:
+        kind (Type[Any]): type of an item to be represented.
+
+    Returns:
+        base.Representation: representation for 'kind'.
+        
+    """
+    if kind in facades:
+        return facades[kind]
+    matches = [k for k in facades if issubclass(kind, k)]
+    if not matches:
+        return facades[str]
+    highest = max(priorities.get(k, 0) for k in matches)
+    matches = [k for k in matches if priorities.get(k, 0) == highest]
+    for match in matches:
+        if not any(
+                other is not match and issubclass(other, match) 
+                for other in matches):
+            return facades[match]
+    return facades[matches[0]]
 
    
 """ Module Level Attributes """
 
-facades: dict[str, base.Representation] = {}
+facades: base.Registry[Type[Any], base.Representation] = base.Registry()
+priorities: base.Registry[Type[Any], int] = base.Registry()
+_cache: weakref.WeakKeyDictionary[
+    Type[Any], base.Representation] = weakref.WeakKeyDictionary()
+_token: tuple[object, int, int] = (None, 0, 0)
+_CLOSE: object = object()
+_renders: collections.OrderedDict[
+    tuple[Any, ...], tuple[Any, Any, str]] = collections.OrderedDict()
+_statistics: collections.Counter[str] = collections.Counter()
 facades[str] = base.Representation(
     name = 'string',
     method = beautify_string,
     start = '',
-    end = '')
+    end = '',
+    color = '\x1b[32m')
+facades[bytes] = base.Representation(
+    name = 'bytes',
+    method = beautify_bytes,
+    start = '<',
+    end = '>',
+    color = '\x1b[35m')
+facades[bytearray] = base.Representation(
+    name = 'bytearray',
+    method = beautify_bytes,
+    start = '<',
+    end = '>',
+    color = '\x1b[35m')
+facades[memoryview] = base.Representation(
+    name = 'memoryview',
+    method = beautify_bytes,
+    start = '<',
+    end = '>',
+    color = '\x1b[35m')
+facades[mmap.mmap] = base.Representation(
+    name = 'mmap',
+    method = beautify_bytes,
+    start = '<',
+    end = '>',
+    color = '\x1b[35m')
 facades[MutableMapping] = base.Representation(
     name = 'dictionary',
     method = beautify_dict,
     start = '{',
-    end = '}')
+    end = '}',
+    color = '\x1b[34m')
 facades[MutableSequence] = base.Representation(
     name = 'list',
     method = beautify_list,
     start = '[',
-    end = ']')
+    end = ']',
+    color = '\x1b[36m')
 facades[Sequence] = base.Representation(
     name = 'tuple',
     method = beautify_list,
     start = '(',
-    end = ')')
+    end = ')',
+    color = '\x1b[36m')
 facades[set] = base.Representation(
     name = 'set',
     method = beautify_list,
     start = '{',
-    end = '}')
+    end = '}',
+    color = '\x1b[33m')
 facades[object] = base.Representation(
     name = 'object', 
     method = beautify_object,
     start = '',
     end = '')
 
+samplers: dict[str, FunctionType] = {
+    'head_tail': _get_head_tail,
+    'strided': _get_strided,
+    'reservoir': _get_reservoir}
+
        
 # def _get_textwrapper() -> textwrap.TextWrapper:
 #     """[summary]
@@ -332,4 +1470,4 @@ facades[object] = base.Representation(
 #         replace_whitespace = False,
 #         drop_whitespace = False,
 #         max_lines = MAX_LENGTH,
-#         placeholder = '...')
\ No newline at end of file
+#         placeholder = '...')
@@ -23,7 +23,30 @@ Contents:
     Results
 
 To Do:
-
+    Add opt-in timing around node completion in Workflow (start/stop times,
+        thread or process, input/output sizes) with export to Chrome
+        trace-event JSON and a plain summary table. Blocked until Workflow
+        and Summary are restored from the chrisjen drafts below.
+    Back Summary with an append-only results store that keeps small or
+        recent entries in memory and spills large ones to disk, loading them
+        lazily through the mapping interface.
+    Give Summary per-key streaming aggregators (count, Welford mean and
+        variance, min/max, approximate quantiles) that update as each node
+        completes and merge across worker processes.
+    Let Outline read 'project.idea' through a lazy source that indexes
+        section offsets on first scan and parses sections only on access.
+    Track which Outline entries and Workflow nodes derive from each
+        settings section so a changed section only rebuilds its subgraph.
+    Add a batch Outline builder that computes the shared 'rules' suffixes and
+        node 'plurals' once and builds each project's Outline in worker
+        processes.
+    Build an immutable compressed sparse-row index of the Workflow graph from
+        the Outline with integer node ids, cached topological order,
+        ancestor and descendant queries, and level sets.
+    Add a content-addressed on-disk checkpoint store keyed by a hash of each
+        node's Outline parameters and upstream result hashes, with lazy
+        loading, size-based eviction, and invalidation, so reruns skip
+        unchanged nodes.
         
 """
 from __future__ import annotations
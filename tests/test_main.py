@@ -1,10 +1,91 @@
 """Main file for unit tests."""
 
 from __future__ import annotations
+import io
+import json
+import pathlib
+import pickle
+
+import pytest
+
+from peaches import __main__
+from peaches import represent
 
 
 def test_peaches() -> None:
     return
 
+def test_read_json() -> None:
+    documents = [
+        {'a': [1, 2.5e3, -0.1, True, False, None], 'b': 'x\\y"z☺'}, 
+        [[], {}], 
+        'string', 
+        3]
+    text = '\n'.join(json.dumps(d) for d in documents)
+    chunk_size = __main__.CHUNK_SIZE
+    __main__.CHUNK_SIZE = 3
+    try:
+        records = list(__main__.read_json(io.StringIO(text), limit = 20))
+    finally:
+        __main__.CHUNK_SIZE = chunk_size
+    assert records == documents
+    text = json.dumps([{'k': i, 'v': list(range(50))} for i in range(5)])
+    records = list(__main__.read_json(io.StringIO(text), limit = 2))
+    assert records == [[{'k': 0, 'v': [0, 1, 2]}, {'k': 1, 'v': [0, 1, 2]}, 
+                        {'k': 2, 'v': [0, 1, 2]}]]
+    deep = '[' * 50000 + ']' * 50000
+    assert len(list(__main__.read_json(io.StringIO(deep), limit = 2))) == 1
+    malformed = {
+        '[1 2]': 'position 3', 
+        '{1: 2}': 'position 1', 
+        '{"a": }': 'position 6', 
+        '[1, 2]]': 'position 6', 
+        '[1, [2, 3}]': 'position 9',
+        '[1, 2': 'end of JSON'}
+    for text, message in malformed.items():
+        with pytest.raises(ValueError, match = message):
+            list(__main__.read_json(io.StringIO(text), limit = 1))
+    return
+
+def test_main(
+    tmp_path: pathlib.Path, 
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ('MAX_LENGTH', 'MAX_WIDTH', 'MAX_STRING', 'MAX_BYTES', 
+                 'SAMPLING'):
+        monkeypatch.setattr(represent, name, getattr(represent, name))
+    lines = tmp_path / 'records.jsonl'
+    lines.write_text('{"a": 1}\n\n["b"]\n')
+    pickles = tmp_path / 'records.pkl'
+    with open(pickles, 'wb') as stream:
+        pickle.dump({'c': 2}, stream)
+        pickle.dump(['d'], stream)
+    assert __main__.main([str(lines), str(pickles), '--max-length', '5']) == 0
+    output = capsys.readouterr().out
+    assert output.count('dictionary: {') == 2
+    assert output.count('list: [') == 2
+    assert 'a: 1}' in output
+    assert 'c: 2}' in output
+    broken = tmp_path / 'broken.json'
+    broken.write_text('[1 2]')
+    assert __main__.main([str(broken), str(lines)]) == 1
+    captured = capsys.readouterr()
+    assert f'peaches: {broken}: expected' in captured.err
+    assert 'a: 1}' in captured.out
+    missing = tmp_path / 'missing.pkl'
+    missing.write_bytes(b'cmissing_module\nThing\n.')
+    assert __main__.main([str(missing), str(lines)]) == 1
+    captured = capsys.readouterr()
+    assert f'peaches: {missing}: No module named' in captured.err
+    assert 'a: 1}' in captured.out
+    for arguments in (
+        [str(lines), '--max-length', '0'],
+        [str(lines), '--max-width', '-1'],
+        [str(broken), '--sampling', 'head_tail']):
+        with pytest.raises(SystemExit):
+            __main__.main(arguments)
+    return
+    
+
 if __name__ == '__main__':
     test_peaches()
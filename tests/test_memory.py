@@ -0,0 +1,137 @@
+"""
+test_memory: tests peak memory and copying costs of the represent module
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2023, Corey Rayburn Yung
+License: Apache-2.0
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+
+
+"""
+from __future__ import annotations
+from collections.abc import Callable
+import timeit
+import tracemalloc
+from typing import Any
+
+import pytest
+
+import peaches
+
+
+SIZE: int = 100000
+FULL_SIZE: int = 20000
+# Peak allocation allowed for a truncated render, regardless of input size.
+TRUNCATED_BUDGET: int = 64 * 1024
+# Peak allocation allowed for a full render, as a multiple of the output size.
+FULL_MULTIPLE: int = 10
+# Nesting depths compared by 'test_depth'.
+DEPTHS: tuple[int, ...] = (100, 800)
+# Characters in the payload of each nested object.
+PAYLOAD: int = 4000
+# Allowed growth in render time beyond the growth in nesting depth. Linear
+# work grows with the depth, while copying each nested object's text into its
+# parent grows with the depth squared (8 times more here).
+DEPTH_TOLERANCE: float = 2.5
+REPEATS: int = 7
+
+
+class Node(object):
+
+    def __init__(self, child: Node | None, payload: str | Node) -> None:
+        self.child = child
+        self.payload = payload
+
+
+def measure(item: Any) -> tuple[int, int]:
+    """Returns peak allocation while beautifying 'item' and the output size."""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        summary = peaches.beautify(item)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak, len(summary)
+
+def time_render(item: Any) -> float:
+    """Returns the shortest of several times taken to beautify 'item'."""
+    return min(timeit.repeat(
+        lambda: peaches.beautify(item), 
+        number = 1, 
+        repeat = REPEATS))
+
+def nest_objects(depth: int) -> Node:
+    item = None
+    for _ in range(depth):
+        item = Node(child = item, payload = 'x' * PAYLOAD)
+    return item
+
+def nest_ladders(depth: int) -> Node:
+    item = None
+    for _ in range(depth):
+        leaf = Node(child = None, payload = 'x' * PAYLOAD)
+        item = Node(child = item, payload = leaf)
+    return item
+
+
+@pytest.mark.parametrize('item', [
+    dict.fromkeys(range(SIZE)),
+    list(range(SIZE)),
+    tuple(range(SIZE)),
+    set(range(SIZE)),
+    'x' * SIZE * 100,
+    b'x' * SIZE * 100,
+    bytearray(SIZE * 100),
+    memoryview(b'x' * SIZE * 100)])
+def test_truncated(item: Any) -> None:
+    peak, _ = measure(item)
+    assert peak < TRUNCATED_BUDGET
+    return
+
+@pytest.mark.parametrize('sampling', ['head_tail', 'strided', 'reservoir'])
+def test_sampled(sampling: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(peaches.represent, 'SAMPLING', sampling)
+    items = (list(range(SIZE)), set(range(SIZE)), dict.fromkeys(range(SIZE)))
+    for item in items:
+        peak, _ = measure(item)
+        assert peak < TRUNCATED_BUDGET
+    return
+
+@pytest.mark.parametrize('item', [
+    dict.fromkeys(range(FULL_SIZE)),
+    list(range(FULL_SIZE)),
+    set(range(FULL_SIZE))])
+def test_full(item: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(peaches.represent, 'MAX_LENGTH', FULL_SIZE)
+    peak, length = measure(item)
+    assert peak < FULL_MULTIPLE * length
+    return
+
+@pytest.mark.parametrize('nest', [nest_objects, nest_ladders])
+def test_depth(
+    nest: Callable[[int], Any], 
+    monkeypatch: pytest.MonkeyPatch) -> None:
+    # Without growing indentation and with whole payloads shown, the output 
+    # grows linearly with depth, so quadratic copying shows up in the times.
+    monkeypatch.setattr(peaches.represent, 'INDENT', '')
+    monkeypatch.setattr(peaches.represent, 'MAX_STRING', PAYLOAD)
+    times = []
+    for depth in DEPTHS:
+        item = nest(depth)
+        peak, length = measure(item)
+        assert peak < FULL_MULTIPLE * length
+        times.append(time_render(item))
+    growth = DEPTHS[-1] / DEPTHS[0]
+    assert times[-1] < times[0] * growth * DEPTH_TOLERANCE
+    return
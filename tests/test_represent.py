@@ -0,0 +1,350 @@
+"""
+test_represent: tests functions in the represent module
+Corey Rayburn Yung <coreyrayburnyung@gmail.com>
+Copyright 2020-2023, Corey Rayburn Yung
+License: Apache-2.0
+
+    Licensed under the Apache License, Version 2.0 (the "License");
+    you may not use this file except in compliance with the License.
+    You may obtain a copy of the License at
+
+        http://www.apache.org/licenses/LICENSE-2.0
+
+    Unless required by applicable law or agreed to in writing, software
+    distributed under the License is distributed on an "AS IS" BASIS,
+    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+    See the License for the specific language governing permissions and
+    limitations under the License.
+    
+    
+"""
+from __future__ import annotations
+import collections
+import dataclasses
+import decimal
+import gc
+import functools
+import mmap
+import sqlite3
+import time
+import zlib
+
+import peaches
+
+
+def test_bytes() -> None:
+    summary = peaches.beautify(b'hello world')
+    assert 'bytes: <' in summary
+    assert 'length: 11' in summary
+    assert 'hex: 68 65 6c 6c 6f 20 77 6f 72 6c 64' in summary
+    assert 'ascii: hello world>' in summary
+    summary = peaches.beautify(bytearray(range(100)))
+    assert 'bytearray: <' in summary
+    assert 'length: 100' in summary
+    assert '0e 0f ...,' in summary
+    buffer = mmap.mmap(-1, 1 << 20)
+    try:
+        summary = peaches.beautify(buffer)
+    finally:
+        buffer.close()
+    assert 'mmap: <' in summary
+    assert f'length: {1 << 20}' in summary
+    peaches.represent.CHECKSUM = True
+    try:
+        summary = peaches.beautify(memoryview(b'abcdefgh')[::2])
+    finally:
+        peaches.represent.CHECKSUM = False
+    assert 'ascii: aceg>' in summary
+    assert f'crc32: {zlib.crc32(b"aceg"):08x}' in summary
+    summary = peaches.beautify([b'x' * 10 ** 7])
+    assert len(summary) < 200
+    assert '(length: 10000000)' in summary
+    return
+
+def test_string() -> None:
+    assert peaches.beautify('short').endswith('string: short')
+    item = 'a' * 1000 + 'b' * 1000
+    summary = peaches.beautify(item)
+    assert 'a' * 20 + '...' + 'b' * 20 + ' (length: 2000)' in summary
+    assert 'a' * 21 not in summary
+    summary = peaches.beautify({'key': item})
+    assert "key: " + 'a' * 20 + '...' + 'b' * 20 + ' (length: 2000)' in summary
+    peaches.represent.COUNT_LINES = True
+    try:
+        summary = peaches.beautify('line\n' * 100)
+    finally:
+        peaches.represent.COUNT_LINES = False
+    assert '(length: 500, lines: 101)' in summary
+    return
+
+def test_sampling() -> None:
+    item = list(range(1000))
+    peaches.represent.SAMPLING = 'head_tail'
+    try:
+        summary = peaches.beautify(item)
+        assert '      9,\n      ...,\n      990,' in summary
+        assert summary.endswith('999]\n')
+        peaches.represent.SAMPLING = 'strided'
+        summary = peaches.beautify(set(item))
+        assert summary.count('...') == 19
+        assert '      0,\n' in summary
+        assert summary.endswith('999}\n')
+        peaches.represent.SAMPLING = 'reservoir'
+        summary = peaches.beautify(dict.fromkeys(item))
+        assert summary.count(': None') == 20
+        summary = peaches.beautify(tuple(item))
+        assert summary.count(',\n') >= 20
+        peaches.represent.MAX_LENGTH = 0
+        for sampling in peaches.represent.samplers:
+            peaches.represent.SAMPLING = sampling
+            assert peaches.represent._get_sample(set(item), 1000) == []
+    finally:
+        peaches.represent.SAMPLING = None
+        peaches.represent.MAX_LENGTH = 20
+    return
+
+class Lazy(object):
+    
+    def __init__(self) -> None:
+        self.stored = 'stored'
+        self.calls = 0
+    
+    @property
+    def expensive(self) -> str:
+        self.calls += 1
+        time.sleep(1)
+        return 'expensive'
+    
+    @functools.cached_property
+    def cached(self) -> str:
+        self.calls += 1
+        return 'cached'
+    
+    @property
+    def name(self) -> str:
+        self.calls += 1
+        return 'lazy'
+
+
+class Query(object):
+    
+    def __init__(self) -> None:
+        self.connection = sqlite3.connect(':memory:')
+    
+    @property
+    def answer(self) -> str:
+        return self.connection.execute("SELECT 'found'").fetchone()[0]
+
+
+def test_evaluate() -> None:
+    item = Lazy()
+    peaches.represent.EVALUATE = 'none'
+    try:
+        summary = peaches.beautify(item)
+        assert 'string: stored' in summary
+        assert '<property>' in summary
+        assert '<cached_property>' in summary
+        assert item.calls == 0
+        item.cached
+        peaches.represent.EVALUATE = 'cached'
+        summary = peaches.beautify(item)
+        assert 'string: cached' in summary
+        assert item.calls == 1
+        peaches.represent.EVALUATE = 'budget'
+        peaches.represent.TIME_BUDGET = 0.01
+        summary = peaches.beautify(item)
+        assert 'string: expensive' in summary
+        assert '<skipped after 0.01s>' in summary
+        peaches.represent.TIME_BUDGET = 1
+        query = Query()
+        assert 'string: found' in peaches.beautify(query)
+        query.connection.close()
+    finally:
+        peaches.represent.EVALUATE = 'all'
+        peaches.represent.TIME_BUDGET = 0.1
+    return
+
+def test_diff() -> None:
+    old = {'a': [1, 2, 3], 'b': {'c': 'x', 'd': {1, 2}}, 'e': 5}
+    new = {'a': [1, 9, 3, 4], 'b': {'c': 'y', 'd': {2, 3}}, 'f': 6}
+    summary = peaches.beautify_diff(old, new)
+    assert "~ item['a'][1]: 2 -> 9," in summary
+    assert "+ item['a'][3]: 4," in summary
+    assert "~ item['b']['c']: 'x' -> 'y'," in summary
+    assert "- item['b']['d']{1}: 1," in summary
+    assert "+ item['b']['d']{3}: 3," in summary
+    assert "- item['e']: 5," in summary
+    assert "+ item['f']: 6}" in summary
+    assert peaches.beautify_diff(old, old).endswith('diff: {}')
+    summary = peaches.beautify_diff({'a' * 1000}, set())
+    assert 'a' * 100 not in summary
+    deep = None
+    for _ in range(10000):
+        deep = [deep]
+    summary = peaches.beautify_diff(deep, [deep[0], 1])
+    assert '+ item[1]: 1}' in summary
+    return
+
+def test_display_width() -> None:
+    assert peaches.display_width('abc') == 3
+    assert peaches.display_width('日本') == 4
+    assert peaches.display_width('\x1b[31mred\x1b[0m') == 3
+    assert peaches.display_width('e\u0301') == 1
+    size = peaches.represent._get_display_width.cache_info().currsize
+    assert peaches.display_width('日' * 1000) == 2000
+    assert peaches.represent._get_display_width.cache_info().currsize == size
+    peaches.represent.DISPLAY_WIDTH = True
+    try:
+        assert peaches.beautify('日本語' * 5).endswith('日本語' * 5)
+        summary = peaches.beautify('日本語' * 30)
+        assert 'string: 日本語日本語日本語日...語日本語日本語日本語 ' in summary
+        item = 'a' * 10 + '\x1b[31m' + 'b' * 50 + '\x1b[0m' + 'c' * 30
+        summary = peaches.beautify(item)
+        assert 'b' * 10 + '\x1b[0m...' in summary
+    finally:
+        peaches.represent.DISPLAY_WIDTH = False
+    peaches.represent.COLOR = True
+    try:
+        summary = peaches.beautify([1, 2])
+    finally:
+        peaches.represent.COLOR = False
+    assert '\x1b[36mlist\x1b[0m: [' in summary
+    return
+
+def test_register_facade() -> None:
+    facades = dict(peaches.represent.facades)
+    priorities = dict(peaches.represent.priorities)
+    try:
+        assert peaches.represent._classify_facade([]).name == 'list'
+        assert peaches.represent._classify_facade(b'').name == 'bytes'
+        assert peaches.represent._classify_facade(bytearray()).name == (
+            'bytearray')
+        assert peaches.represent._classify_facade(
+            collections.OrderedDict()).name == 'dictionary'
+
+        @peaches.register_facade(decimal.Decimal, name = 'decimal')
+        def beautify_decimal(
+            item: decimal.Decimal, 
+            facade: peaches.Representation, 
+            offsets: int) -> str:
+            return f'{peaches.represent._get_indent(offsets)}decimal: {item}'
+
+        assert peaches.beautify(decimal.Decimal('1.5')).endswith(
+            'decimal: 1.5')
+        peaches.register_facade(
+            collections.abc.Sequence, 
+            peaches.represent.facades[collections.abc.Sequence],
+            priority = 1)
+        assert peaches.represent._classify_facade([]).name == 'tuple'
+        peaches.represent.facades[list] = peaches.represent.base.Representation(
+            name = 'array', 
+            method = peaches.represent.beautify_list)
+        assert peaches.represent._classify_facade([]).name == 'array'
+        version = peaches.represent.facades.version
+        peaches.represent.facades.pop(int, None)
+        peaches.represent.facades.setdefault(list, None)
+        assert peaches.represent.facades.version == version
+    finally:
+        peaches.represent.facades.clear()
+        peaches.represent.facades.update(facades)
+        peaches.represent.priorities.clear()
+        peaches.represent.priorities.update(priorities)
+    assert peaches.represent._classify_facade([]).name == 'list'
+    return
+
+@dataclasses.dataclass(frozen = True)
+class Frozen(object):
+    
+    name: str
+    values: tuple[int, ...]
+
+
+class Versioned(object):
+    
+    def __init__(self) -> None:
+        self.values = [1, 2]
+        self._version = 0
+
+
+class Box(object):
+    
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+
+def test_cache() -> None:
+    peaches.represent.CACHE_SIZE = 2
+    peaches.clear_cache()
+    try:
+        item = Frozen(name = 'frozen', values = (1, 2))
+        first = peaches.beautify(item)
+        assert peaches.cache_info()['misses'] == 1
+        assert peaches.beautify(item) == first
+        assert peaches.cache_info()['hits'] >= 1
+        versioned = Versioned()
+        peaches.beautify(versioned)
+        versioned.values.append(3)
+        versioned._version += 1
+        assert '3]' in peaches.beautify(versioned)
+        mutable = [1, 2]
+        peaches.beautify(mutable)
+        mutable.append(3)
+        assert '3]' in peaches.beautify(mutable)
+        assert peaches.cache_info()['size'] <= 2
+        size = peaches.cache_info()['size']
+        del versioned
+        gc.collect()
+        assert peaches.cache_info()['size'] < size
+        box = Box(value = 1)
+        assert peaches.represent._is_cacheable(
+            Frozen(name = 'nested', values = (1, ('a', b'b'))))
+        assert not peaches.represent._is_cacheable((1, 2))
+        assert not peaches.represent._is_cacheable((box,))
+        assert not peaches.represent._is_cacheable(frozenset([box]))
+        assert not peaches.represent._is_cacheable(
+            Frozen(name = 'boxed', values = (box,)))
+        size = peaches.cache_info()['size']
+        peaches.beautify('x' * 100000)
+        assert peaches.cache_info()['size'] == size
+        peaches.beautify(item)
+        peaches.register_facade(Frozen, peaches.represent.base.Representation(
+            name = 'frozen', 
+            method = lambda item, facade, offsets: 'replaced'))
+        assert peaches.beautify(item).endswith('replaced')
+    finally:
+        peaches.represent.facades.pop(Frozen, None)
+        peaches.represent.priorities.pop(Frozen, None)
+        peaches.represent.CACHE_SIZE = 0
+        peaches.clear_cache()
+    return
+
+class Link(object):
+    
+    def __init__(self, following: Link | None) -> None:
+        self.following = following
+
+
+def test_deep() -> None:
+    item = None
+    for _ in range(2000):
+        item = Link(following = item)
+    summary = peaches.beautify(item)
+    assert summary.count('following: ') == 2000
+    assert summary.rstrip().endswith('None')
+    item = Link(following = None)
+    item.following = item
+    assert summary.count('link: ') == 2000
+    assert peaches.beautify(item).rstrip().endswith('<cycle>')
+    return
+
+
+if __name__ == '__main__':
+    test_bytes()
+    test_string()
+    test_sampling()
+    test_evaluate()
+    test_diff()
+    test_display_width()
+    test_register_facade()
+    test_cache()
+    test_deep()